@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compare the legacy and cached prompt layouts of extract.py on the same papers
+- Runs identical rows through each layout against a real or mock endpoint
+- Reports latency, prompt-cache hit tokens from resp.usage and estimated cost
+- Without credentials, point --base-url at mock_endpoint.py
+"""
+
+import argparse, asyncio, json, time
+from pathlib import Path
+
+import extract as E
+
+async def run_layout(df, cols, layout, model, concurrency, api_key, base_url, repair=False):
+    E.reset_usage_stats()
+    system_prompt, tmpl = E.PROMPT_LAYOUTS[layout]
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(row):
+        title, abstract, year, venue, url = E._row_fields(row, cols)
+        user_prompt = E.fmt_user(title, abstract, year, venue, url, tmpl=tmpl)
+        async with sem:
+            await E.call_llm_async(model, system_prompt, user_prompt, api_key=api_key, base_url=base_url,
+                                   abstract=abstract, repair=repair, title=title)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one(row) for _, row in df.iterrows()), return_exceptions=True)
+    wall = time.perf_counter() - start
+    failed = sum(isinstance(r, Exception) for r in results)
+    return {"layout": layout, "rows": len(df), "failed": failed, "wall_s": wall, **E.USAGE_STATS}
+
+def estimate_cost(stats, price_input, price_cached, price_output):
+    """USD, prices per 1M tokens; cache-hit tokens are billed at price_cached"""
+    miss = stats["prompt_tokens"] - stats["cached_tokens"]
+    return (miss * price_input + stats["cached_tokens"] * price_cached
+            + stats["completion_tokens"] * price_output) / 1e6
+
+def main():
+    ap = argparse.ArgumentParser(description="对比 legacy / cached 两种 prompt 布局的延迟、缓存命中与成本")
+    ap.add_argument("--in", dest="infile", required=True, help="输入文件 (.xlsx 或 .parquet)")
+    ap.add_argument("--rows", type=int, default=20, help="参与对比的记录数(默认20)")
+    ap.add_argument("--model", default="deepseek-chat", help="模型名称")
+    ap.add_argument("--sheet", default=None, help="Excel工作表名称或索引")
+    ap.add_argument("--concurrency", type=int, default=1, help="并发请求数(默认1，延迟更可比)")
+    ap.add_argument("--layouts", nargs="+", choices=list(E.PROMPT_LAYOUTS), default=list(E.PROMPT_LAYOUTS),
+                    help="要对比的布局")
+    ap.add_argument("--price-input", type=float, default=None, help="未命中缓存的输入单价 (USD / 1M tokens)")
+    ap.add_argument("--price-cached", type=float, default=None, help="命中缓存的输入单价 (USD / 1M tokens)")
+    ap.add_argument("--price-output", type=float, default=None, help="输出单价 (USD / 1M tokens)")
+    ap.add_argument("--api-key", default=None, help="API密钥")
+    ap.add_argument("--base-url", default="https://api.deepseek.com", help="API基础URL（可指向 mock 服务）")
+    ap.add_argument("--repair", action="store_true", help="开启定向修复（修复用量单独统计，不计入对比）")
+    ap.add_argument("--report", default=None, help="将结果另存为 JSON")
+    args = ap.parse_args()
+
+    df, cols = E.load_input(Path(args.infile), sheet=args.sheet)
+    df = df.head(args.rows)
+    prices = (args.price_input, args.price_cached, args.price_output)
+
+    report = []
+    for layout in args.layouts:
+        E.log_with_flush(f"布局 {layout}: {len(df)} 条")
+        stats = asyncio.run(run_layout(df, cols, layout, args.model, args.concurrency, args.api_key, args.base_url,
+                                       repair=args.repair))
+        if None not in prices:
+            stats["cost_usd"] = estimate_cost(stats, *prices)
+        report.append(stats)
+
+    print(f"\n{'layout':<8} {'ok':>5} {'avg latency':>12} {'prompt tok':>11} {'cached tok':>11} {'hit':>5} {'cost($)':>10}")
+    for s in report:
+        calls = s["calls"] or 1
+        hit = s["cached_tokens"] / s["prompt_tokens"] * 100 if s["prompt_tokens"] else 0
+        cost = f"{s['cost_usd']:.4f}" if "cost_usd" in s else "-"
+        print(f"{s['layout']:<8} {s['rows'] - s['failed']:>5} {s['latency_s'] / calls:>11.2f}s "
+              f"{s['prompt_tokens']:>11,} {s['cached_tokens']:>11,} {hit:>4.0f}% {cost:>10}")
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        E.log_with_flush(f"结果已保存: {args.report}")
+
+if __name__ == "__main__":
+    main()
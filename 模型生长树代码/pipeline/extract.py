@@ -6,6 +6,8 @@ Robust version of DeepSeek pipeline with better error handling and monitoring
 - Better timeout and retry logic
 - Reduced concurrency to avoid rate limits
 - Real-time progress monitoring
+- Compiled schema validation with targeted repair requests instead of full retries
+- Optional cached prompt layout (frozen static prefix, paper fields last) with cache-hit accounting
 """
 
 import argparse, json, os, re, asyncio, random, unicodedata, time, sys
@@ -37,6 +39,29 @@ SYSTEM += """
 
 CORE_TYPES  = {"Model","Variant","AdapterModel"}
 
+# -------------------- prompt layouts --------------------
+SCHEMA_BLOCK   = "\n\nJSON Schema (for reference):\n" + SCHEMA
+SYSTEM_MESSAGE = SYSTEM + SCHEMA_BLOCK
+
+def _split_user_template(tmpl: str):
+    """Split user_template.txt into intro / per-paper block / static instructions"""
+    head, sep_instr, instructions = tmpl.partition("【执行要点】")
+    intro, sep_paper, paper = head.partition("<TITLE>")
+    if not sep_instr or not sep_paper:
+        raise ValueError("user_template.txt 缺少 <TITLE> 或 【执行要点】 标记，无法构建 cached 布局")
+    return intro.strip(), (sep_paper + paper).strip() + "\n", (sep_instr + instructions).strip()
+
+_INTRO, PAPER_TMPL, _INSTRUCTIONS = _split_user_template(USER_TMPL)
+# the examples echo paper fields; neutral placeholders keep the prefix byte-identical across papers
+for _k in ("title", "abstract", "year", "venue", "url"):
+    _INSTRUCTIONS = _INSTRUCTIONS.replace("{" + _k + "}", f"<{_k.upper()}>")
+
+# legacy: paper fields lead the user message; cached: one frozen prefix, paper fields last
+PROMPT_LAYOUTS = {
+    "legacy": (SYSTEM_MESSAGE, USER_TMPL),
+    "cached": (SYSTEM_MESSAGE + "\n\n" + _INTRO + "\n\n" + _INSTRUCTIONS, PAPER_TMPL),
+}
+
 # -------------------- utils --------------------
 def log_with_flush(msg):
     """Print with immediate flush and timestamp"""
@@ -52,8 +77,8 @@ def _nz(x):
         pass
     return "" if x is None else str(x)
 
-def fmt_user(title:str, abstract:str, year=None, venue:str="", url:str="") -> str:
-    p = USER_TMPL
+def fmt_user(title:str, abstract:str, year=None, venue:str="", url:str="", tmpl:str=USER_TMPL) -> str:
+    p = tmpl
     return (p.replace("{title}", _nz(title))
              .replace("{abstract}", _nz(abstract))
              .replace("{year}", _nz(year))
@@ -61,12 +86,17 @@ def fmt_user(title:str, abstract:str, year=None, venue:str="", url:str="") -> st
              .replace("{url}", _nz(url)))
 
 def _parse_json_strict_or_fallback(txt: str):
+    txt = txt or ""
     try:
         return json.loads(txt)
     except Exception:
-        m = re.search(r"\{.*\}", txt, flags=re.S)
-        if m:
-            return json.loads(m.group(0))
+        # decode the first complete object instead of a greedy {.*} span
+        start = txt.find("{")
+        if start >= 0:
+            try:
+                return json.JSONDecoder().raw_decode(txt[start:])[0]
+            except ValueError:
+                pass
         raise ValueError("模型未返回合法 JSON。片段: " + txt[:400])
 
 def _norm_text(s: str) -> str:
@@ -143,10 +173,264 @@ def _ensure_2_to_4_quotes(quotes, abstract: str):
                 break
     return kept[:4]
 
+# -------------------- schema validation & targeted repair --------------------
+_JSON_TYPES = {
+    "object": dict, "array": list, "string": str, "boolean": bool,
+    "integer": int, "number": (int, float), "null": type(None),
+}
+
+def _type_ok(value, names):
+    for name in names:
+        if name in ("integer", "number") and isinstance(value, bool):
+            continue
+        if isinstance(value, _JSON_TYPES[name]):
+            return True
+    return False
+
+_SCHEMA_KEYWORDS = {
+    "type", "enum", "required", "properties", "items", "minItems", "maxItems",
+    "minLength", "minimum", "maximum", "if", "then",
+    "$schema", "title", "description",          # annotations, no effect on validation
+}
+
+def _compile_schema(node: dict, where: str = "#"):
+    """Compile the JSON Schema subset used by schema.json into a check(value, path, errors) closure"""
+    unknown = set(node) - _SCHEMA_KEYWORDS
+    if unknown:
+        raise ValueError(f"schema.json {where}: unsupported keyword(s) {sorted(unknown)}; extend _compile_schema first")
+    types = node.get("type")
+    types = [types] if isinstance(types, str) else types
+    enum = node.get("enum")
+    required = node.get("required", [])
+    props = {k: _compile_schema(v, f"{where}/properties/{k}") for k, v in node.get("properties", {}).items()}
+    items = _compile_schema(node["items"], f"{where}/items") if "items" in node else None
+    min_items, max_items = node.get("minItems"), node.get("maxItems")
+    min_len = node.get("minLength")
+    lo, hi = node.get("minimum"), node.get("maximum")
+    cond = ((_compile_schema(node["if"], f"{where}/if"), _compile_schema(node.get("then", {}), f"{where}/then"))
+            if "if" in node else None)
+
+    def check(value, path, errors):
+        if types and not _type_ok(value, types):
+            errors.append(f"{path}: expected {'|'.join(types)}, got {type(value).__name__}")
+            return
+        if enum is not None and value not in enum:
+            errors.append(f"{path}: {value!r} not one of {enum}")
+        if isinstance(value, dict):
+            for k in required:
+                if k not in value:
+                    errors.append(f"{path}.{k}: required")
+            for k, sub in props.items():
+                if k in value:
+                    sub(value[k], f"{path}.{k}", errors)
+            if cond:
+                probe = []
+                cond[0](value, path, probe)
+                if not probe:
+                    cond[1](value, path, errors)
+        elif isinstance(value, list):
+            if min_items is not None and len(value) < min_items:
+                errors.append(f"{path}: expected at least {min_items} items, got {len(value)}")
+            if max_items is not None and len(value) > max_items:
+                errors.append(f"{path}: expected at most {max_items} items, got {len(value)}")
+            if items:
+                for i, v in enumerate(value):
+                    items(v, f"{path}[{i}]", errors)
+        elif isinstance(value, str):
+            if min_len is not None and len(value.strip()) < min_len:
+                errors.append(f"{path}: empty string")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            if lo is not None and value < lo:
+                errors.append(f"{path}: {value} < {lo}")
+            if hi is not None and value > hi:
+                errors.append(f"{path}: {value} > {hi}")
+    return check
+
+_SCHEMA_CHECK = _compile_schema(json.loads(SCHEMA))
+DOC_TYPES     = set(json.loads(SCHEMA)["properties"]["doc_type"]["enum"])
+
+# fields the pipeline never reads (paper, fit_score) or already tolerates (null lists, read with `or []`)
+_IGNORED_ERRORS = (
+    re.compile(r"^\$\.paper(\.|\[|:)"),
+    re.compile(r"^\$\.fit_score(\.|\[|:)"),
+    re.compile(r"^\$\.core_brief\.(model_names_brief|base_models_brief|innovation_quotes): expected array, got NoneType$"),
+)
+
+def validate_response(js, abstract: str = "") -> list[str]:
+    """Schema errors plus the verbatim-quote rule, minus errors in fields the pipeline ignores;
+    an empty list means the response is usable as-is"""
+    errors = []
+    _SCHEMA_CHECK(js, "$", errors)
+    errors = [e for e in errors if not any(p.match(e) for p in _IGNORED_ERRORS)]
+    cb = js.get("core_brief") if isinstance(js, dict) else None
+    quotes = cb.get("innovation_quotes") if isinstance(cb, dict) else None
+    abs_norm = _norm_text(abstract).lower()
+    if abs_norm and isinstance(quotes, list):
+        for i, q in enumerate(quotes):
+            if isinstance(q, str) and _norm_text(q).lower() not in abs_norm:
+                errors.append(f"$.core_brief.innovation_quotes[{i}]: not found verbatim in abstract")
+    return errors
+
+REPAIR_SYSTEM = (
+    "You repair JSON fragments produced by an extraction model. "
+    "Fix exactly the listed validator errors, keep every valid field unchanged, "
+    "and return only the corrected fragment as a single JSON object."
+)
+
+# errors _build_core_brief patches on its own (_ensure_2_to_4_quotes / summary fallbacks); anything else needs a retry
+_PATCHABLE_ERRORS = (
+    re.compile(r"^\$\.core_brief\.innovation_quotes\[\d+\]: not found verbatim in abstract$"),
+    re.compile(r"^\$\.core_brief\.innovation_quotes: expected at most \d+ items"),
+    re.compile(r"^\$\.core_brief\.relation_summary_(zh|en): (empty string|required)$"),
+)
+
+def _heuristically_patchable(js, errors) -> bool:
+    return isinstance(js, dict) and all(any(p.match(e) for p in _PATCHABLE_ERRORS) for e in errors)
+
+# tokens_saved: full-call tokens a retry would have cost, minus the repair call's tokens (only when a retry was the alternative)
+# tokens_added: repair tokens spent where the heuristic patching would have sufficed, or that did not avoid a retry
+REPAIR_STATS = {"attempts": 0, "success": 0, "repair_tokens": 0, "tokens_saved": 0, "tokens_added": 0}
+
+def _usage_tokens(resp) -> int:
+    usage = getattr(resp, "usage", None)
+    return int(getattr(usage, "total_tokens", 0) or 0)
+
+def _repair_fragment(js, errors):
+    """Smallest sub-object covering all errors: core_brief when every error sits under it, else the whole object"""
+    cb = js.get("core_brief") if isinstance(js, dict) else None
+    if isinstance(cb, dict) and all(e.startswith("$.core_brief.") for e in errors):
+        return "core_brief", cb
+    return None, js
+
+_MAX_ITEMS_ERROR = re.compile(r": expected at most \d+ items")
+
+def _repair_prompt(fragment_text: str, path: str, errors: list[str], title: str, abstract: str) -> str:
+    lines = ["Validator errors:"] + [f"- {e}" for e in errors]
+    lines += ["", f"Fragment at {path}:", fragment_text]
+    # title + abstract whenever content must be (re)written; trimming an over-long list needs no source
+    if not all(_MAX_ITEMS_ERROR.search(e) for e in errors):
+        lines += ["", "Source paper (fill fields only from it; quotes must be verbatim substrings of the abstract):",
+                  f"Title: {title}", "Abstract:", abstract]
+    return "\n".join(lines)
+
+async def _repair_async(client, model: str, js, txt: str, errors: list[str], abstract: str, full_tokens: int,
+                        retry_alternative: bool, title: str = ""):
+    if js is None:
+        key, path, fragment_text = None, "$ (unparseable)", txt
+    else:
+        key, fragment = _repair_fragment(js, errors)
+        path = f"$.{key}" if key else "$"
+        fragment_text = json.dumps(fragment, ensure_ascii=False)
+
+    REPAIR_STATS["attempts"] += 1
+    used = 0
+    try:
+        t0 = time.perf_counter()
+        resp = await client.chat.completions.create(
+            model=model,
+            temperature=0.0,
+            messages=[
+                {"role":"system","content":REPAIR_SYSTEM},
+                {"role":"user","content":_repair_prompt(fragment_text, path, errors, title, abstract)}
+            ],
+            response_format={"type":"json_object"}
+        )
+        _record_usage(resp, time.perf_counter() - t0, REPAIR_USAGE_STATS)
+        used = _usage_tokens(resp)
+        REPAIR_STATS["repair_tokens"] += used
+        patch = _parse_json_strict_or_fallback(resp.choices[0].message.content)
+    except Exception as e:
+        log_with_flush(f"修复请求失败 ({type(e).__name__}: {e})")
+        REPAIR_STATS["tokens_added"] += used
+        return None
+
+    if key and isinstance(patch, dict) and list(patch) == [key]:
+        patch = patch[key]
+    fixed = {**js, key: patch} if key else patch
+    remaining = validate_response(fixed, abstract)
+    if remaining:
+        log_with_flush(f"修复后仍有 {len(remaining)} 处错误: {remaining[:3]}")
+        REPAIR_STATS["tokens_added"] += used
+        return None
+    REPAIR_STATS["success"] += 1
+    if retry_alternative:
+        REPAIR_STATS["tokens_saved"] += max(0, full_tokens - used)
+    else:
+        REPAIR_STATS["tokens_added"] += used
+    return fixed
+
+async def _validate_or_repair(client, model: str, txt: str, abstract: str, full_tokens: int, repair: bool = True,
+                              title: str = ""):
+    try:
+        js = _parse_json_strict_or_fallback(txt)
+    except ValueError:
+        # the raw text is sent as the fragment itself; keep it out of the error message
+        js, errors = None, ["$: invalid or truncated JSON"]
+    else:
+        errors = validate_response(js, abstract)
+    if not errors:
+        return js
+
+    log_with_flush(f"Schema 校验失败 ({len(errors)} 处): {errors[:3]}")
+    patchable = _heuristically_patchable(js, errors)
+    if repair:
+        fixed = await _repair_async(client, model, js, txt, errors, abstract, full_tokens,
+                                    retry_alternative=not patchable, title=title)
+        if fixed is not None:
+            return fixed
+    # only errors _build_core_brief can patch fall through; type errors would crash it outside the retry loop
+    if patchable:
+        return js
+    raise ValueError("响应未通过 Schema 校验: " + "; ".join(errors[:5]))
+
+def log_repair_stats():
+    s = REPAIR_STATS
+    if not s["attempts"]:
+        return
+    rate = s["success"] / s["attempts"] * 100
+    log_with_flush(f"定向修复: 成功 {s['success']}/{s['attempts']} ({rate:.0f}%), "
+                   f"修复消耗 {s['repair_tokens']:,} tokens, 较整次重试节省约 {s['tokens_saved']:,} tokens, "
+                   f"额外花费 {s['tokens_added']:,} tokens（本可启发式修补或修复失败）")
+
+# -------------------- usage / prompt-cache accounting --------------------
+# full extraction calls and repair calls are tracked separately so layout comparisons stay clean
+USAGE_STATS        = {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0, "latency_s": 0.0}
+REPAIR_USAGE_STATS = dict(USAGE_STATS)
+
+def _cached_tokens(usage) -> int:
+    hit = getattr(usage, "prompt_cache_hit_tokens", None)          # DeepSeek
+    if hit is None:
+        details = getattr(usage, "prompt_tokens_details", None)    # OpenAI-compatible
+        hit = getattr(details, "cached_tokens", None)
+    return int(hit or 0)
+
+def _record_usage(resp, latency_s: float, stats: dict = USAGE_STATS):
+    usage = getattr(resp, "usage", None)
+    stats["calls"] += 1
+    stats["latency_s"] += latency_s
+    stats["prompt_tokens"] += int(getattr(usage, "prompt_tokens", 0) or 0)
+    stats["completion_tokens"] += int(getattr(usage, "completion_tokens", 0) or 0)
+    stats["cached_tokens"] += _cached_tokens(usage)
+
+def reset_usage_stats():
+    for stats in (USAGE_STATS, REPAIR_USAGE_STATS, REPAIR_STATS):
+        for k in stats:
+            stats[k] = 0.0 if k == "latency_s" else 0
+
+def log_usage_stats():
+    for label, s in (("用量", USAGE_STATS), ("修复请求用量", REPAIR_USAGE_STATS)):
+        if not s["calls"]:
+            continue
+        hit = s["cached_tokens"] / s["prompt_tokens"] * 100 if s["prompt_tokens"] else 0
+        log_with_flush(f"{label}: {s['calls']} 次调用, 平均延迟 {s['latency_s']/s['calls']:.2f}s, "
+                       f"prompt {s['prompt_tokens']:,} tokens (缓存命中 {s['cached_tokens']:,}, {hit:.0f}%), "
+                       f"completion {s['completion_tokens']:,} tokens")
+
 # -------------------- async OpenAI call with better error handling --------------------
 async def call_llm_async(model:str, system_prompt:str, user_prompt:str,
                          api_key:str|None, base_url:str|None,
-                         timeout_s:float=120.0, max_retries:int=6, backoff_base:float=1.0):
+                         timeout_s:float=120.0, max_retries:int=6, backoff_base:float=1.0,
+                         abstract:str="", repair:bool=True, title:str=""):
     from openai import AsyncOpenAI
     from openai import AuthenticationError, RateLimitError, APIError, APITimeoutError
 
@@ -161,17 +445,20 @@ async def call_llm_async(model:str, system_prompt:str, user_prompt:str,
     for attempt in range(max_retries):
         try:
             log_with_flush(f"API调用尝试 {attempt+1}/{max_retries}")
+            t0 = time.perf_counter()
             resp = await client.chat.completions.create(
                 model=model,
                 temperature=0.1,
                 messages=[
-                    {"role":"system","content":system_prompt + "\n\nJSON Schema (for reference):\n" + SCHEMA},
+                    {"role":"system","content":system_prompt},
                     {"role":"user","content":user_prompt}
                 ],
                 response_format={"type":"json_object"}
             )
+            _record_usage(resp, time.perf_counter() - t0)
             txt = resp.choices[0].message.content
-            result = _parse_json_strict_or_fallback(txt)
+            result = await _validate_or_repair(client, model, txt, _nz(abstract), _usage_tokens(resp), repair,
+                                               title=_nz(title))
             log_with_flush(f"API调用成功")
             return result
             
@@ -255,18 +542,25 @@ def _build_non_core(js:dict, orig:dict):
         return None
     return {**orig, "doc_type": js.get("doc_type")}
 
-async def _process_row(idx:int, row, cols, model, semaphore, api_key, base_url):
-    title    = row.get(cols["title"])
-    abstract = row.get(cols["abstract"])
-    year     = row.get(cols["year"]) if cols["year"] else None
-    venue    = row.get(cols["venue"]) if cols["venue"] else ""
-    url      = row.get(cols["url"]) if cols["url"] else ""
+def _row_fields(row, cols):
+    return (
+        row.get(cols["title"]),
+        row.get(cols["abstract"]),
+        row.get(cols["year"]) if cols["year"] else None,
+        row.get(cols["venue"]) if cols["venue"] else "",
+        row.get(cols["url"]) if cols["url"] else "",
+    )
+
+async def _process_row(idx:int, row, cols, model, semaphore, api_key, base_url, repair=True, layout="legacy"):
+    title, abstract, year, venue, url = _row_fields(row, cols)
 
-    user_prompt = fmt_user(title, abstract, year, venue, url)
+    system_prompt, tmpl = PROMPT_LAYOUTS[layout]
+    user_prompt = fmt_user(title, abstract, year, venue, url, tmpl=tmpl)
 
     async with semaphore:
         try:
-            js = await call_llm_async(model, SYSTEM, user_prompt, api_key=api_key, base_url=base_url)
+            js = await call_llm_async(model, system_prompt, user_prompt, api_key=api_key, base_url=base_url,
+                                      abstract=abstract, repair=repair, title=title)
         except Exception as e:
             log_with_flush(f"处理第{idx}行失败: {e}")
             raise
@@ -280,7 +574,8 @@ async def _process_row(idx:int, row, cols, model, semaphore, api_key, base_url):
     )
 
 # -------------------- batch processing with better monitoring --------------------
-async def process_batch_robust(df_batch, batch_num, total_batches, cols, model, concurrency, api_key, base_url):
+async def process_batch_robust(df_batch, batch_num, total_batches, cols, model, concurrency, api_key, base_url, repair=True,
+                               layout="legacy"):
     """Process a single batch with enhanced monitoring"""
     batch_size = len(df_batch)
     log_with_flush(f"{'='*60}")
@@ -290,10 +585,11 @@ async def process_batch_robust(df_batch, batch_num, total_batches, cols, model,
     
     # 使用指定的并发数，但保持合理上限
     sem = asyncio.Semaphore(max(1, min(concurrency, 30)))  # 最大并发限制为30
+    reset_usage_stats()  # 每批次单独统计用量与修复
     tasks = []
     
     for idx, (_, row) in enumerate(df_batch.iterrows()):
-        tasks.append(_process_row(idx, row, cols, model, sem, api_key, base_url))
+        tasks.append(_process_row(idx, row, cols, model, sem, api_key, base_url, repair, layout))
 
     core_brief_rows, non_core_rows = [], []
     processed = 0
@@ -322,6 +618,8 @@ async def process_batch_robust(df_batch, batch_num, total_batches, cols, model,
     
     elapsed = time.time() - start_time
     log_with_flush(f"批次 {batch_num} 完成: {processed}/{batch_size} 条, 用时 {elapsed/60:.1f}分钟")
+    log_usage_stats()
+    log_repair_stats()
     return core_brief_rows, non_core_rows
 
 def save_batch_results(core_rows, non_core_rows, batch_num, output_dir):
@@ -350,12 +648,9 @@ def save_batch_results(core_rows, non_core_rows, batch_num, output_dir):
     return batch_file
 
 # -------------------- main robust processing --------------------
-async def run_robust_async(in_file: Path, output_dir: str, final_output: str, model: str,
-                          title_col="title", abstract_col="abstract",
-                          year_col="year", venue_col="venue", url_col="url",
-                          sheet=None, batch_size=2000, concurrency=20,  # 默认并发数20
-                          api_key=None, base_url=None, start_batch=1):
-    
+def load_input(in_file: Path, title_col="title", abstract_col="abstract",
+               year_col="year", venue_col="venue", url_col="url", sheet=None):
+    """Read the input file and resolve the column mapping used by _process_row"""
     # Read input file
     if sheet is None:
         if str(in_file).endswith('.parquet'):
@@ -375,6 +670,15 @@ async def run_robust_async(in_file: Path, output_dir: str, final_output: str, mo
     
     cols = {"title": title_col, "abstract": abstract_col,
             "year": year_col_opt, "venue": venue_col_opt, "url": url_col_opt}
+    return df, cols
+
+async def run_robust_async(in_file: Path, output_dir: str, final_output: str, model: str,
+                          title_col="title", abstract_col="abstract",
+                          year_col="year", venue_col="venue", url_col="url",
+                          sheet=None, batch_size=2000, concurrency=20,  # 默认并发数20
+                          api_key=None, base_url=None, start_batch=1, repair=True, layout="legacy"):
+    
+    df, cols = load_input(in_file, title_col, abstract_col, year_col, venue_col, url_col, sheet)
     
     total_rows = len(df)
     total_batches = (total_rows + batch_size - 1) // batch_size
@@ -388,6 +692,8 @@ async def run_robust_async(in_file: Path, output_dir: str, final_output: str, mo
     log_with_flush(f"总批次数: {total_batches}")
     log_with_flush(f"并发数: {concurrency} (保守设置)")
     log_with_flush(f"开始批次: {start_batch}")
+    log_with_flush(f"定向修复: {'开启' if repair else '关闭'}")
+    log_with_flush(f"Prompt 布局: {layout}")
     log_with_flush(f"输出目录: {output_dir}")
     
     # Process batches
@@ -398,7 +704,7 @@ async def run_robust_async(in_file: Path, output_dir: str, final_output: str, mo
         
         try:
             core_rows, non_core_rows = await process_batch_robust(
-                df_batch, batch_num, total_batches, cols, model, concurrency, api_key, base_url
+                df_batch, batch_num, total_batches, cols, model, concurrency, api_key, base_url, repair, layout
             )
             
             save_batch_results(core_rows, non_core_rows, batch_num, output_dir)
@@ -431,6 +737,9 @@ def main():
     ap.add_argument("--start-batch", type=int, default=1, help="开始处理的批次号（用于恢复）")
     ap.add_argument("--api-key", default=None, help="API密钥")
     ap.add_argument("--base-url", default="https://api.deepseek.com", help="API基础URL")
+    ap.add_argument("--no-repair", action="store_true", help="关闭 Schema 校验失败后的定向修复请求")
+    ap.add_argument("--prompt-layout", choices=list(PROMPT_LAYOUTS), default="legacy",
+                    help="cached: 静态指令与 Schema 合并为固定前缀，论文字段置于末尾，以命中服务端 prompt 缓存")
     
     args = ap.parse_args()
     
@@ -439,7 +748,8 @@ def main():
         title_col=args.title_col, abstract_col=args.abstract_col,
         year_col=args.year_col, venue_col=args.venue_col, url_col=args.url_col,
         sheet=args.sheet, batch_size=args.batch_size, concurrency=args.concurrency,
-        api_key=args.api_key, base_url=args.base_url, start_batch=args.start_batch
+        api_key=args.api_key, base_url=args.base_url, start_batch=args.start_batch,
+        repair=not args.no_repair, layout=args.prompt_layout
     ))
 
 if __name__ == "__main__":
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Minimal OpenAI-compatible mock of /chat/completions with provider-style prefix caching
+- Counts a request's longest shared prefix with earlier requests as cached (in 64-token blocks, like DeepSeek)
+- Reports it as prompt_cache_hit_tokens (DeepSeek) or prompt_tokens_details.cached_tokens (OpenAI)
+- Sleeps in proportion to uncached vs cached tokens so layouts show a latency difference
+- Replies with a valid non-core extraction so no repair or retry is triggered
+
+Usage:
+    python mock_endpoint.py --port 8765
+    python compare_prompt_layouts.py --in papers.xlsx --base-url http://127.0.0.1:8765 --api-key mock
+"""
+
+import argparse, json, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CACHE_BLOCK_TOKENS = 64
+CHARS_PER_TOKEN    = 2          # rough average for mixed Chinese / English prompts
+MAX_REMEMBERED     = 256
+
+def _common_prefix_len(a: str, b: str) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+class MockState:
+    def __init__(self, ms_per_1k_uncached: float, ms_per_1k_cached: float, usage_style: str):
+        self.ms_per_1k_uncached = ms_per_1k_uncached
+        self.ms_per_1k_cached = ms_per_1k_cached
+        self.usage_style = usage_style
+        self.seen = []
+        self.lock = threading.Lock()
+
+    def usage_for(self, prompt: str, completion: str) -> dict:
+        with self.lock:
+            shared = max((_common_prefix_len(prompt, p) for p in self.seen), default=0)
+            self.seen = (self.seen + [prompt])[-MAX_REMEMBERED:]
+        prompt_tokens = len(prompt) // CHARS_PER_TOKEN
+        cached = (shared // CHARS_PER_TOKEN) // CACHE_BLOCK_TOKENS * CACHE_BLOCK_TOKENS
+        completion_tokens = len(completion) // CHARS_PER_TOKEN
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                 "total_tokens": prompt_tokens + completion_tokens}
+        if self.usage_style == "deepseek":
+            usage.update(prompt_cache_hit_tokens=cached, prompt_cache_miss_tokens=prompt_tokens - cached)
+        else:
+            usage["prompt_tokens_details"] = {"cached_tokens": cached}
+        return usage
+
+    def delay_s(self, usage: dict) -> float:
+        cached = usage.get("prompt_cache_hit_tokens", usage.get("prompt_tokens_details", {}).get("cached_tokens", 0))
+        uncached = usage["prompt_tokens"] - cached
+        return (uncached * self.ms_per_1k_uncached + cached * self.ms_per_1k_cached) / 1e6
+
+def make_handler(state: MockState):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            messages = body.get("messages", [])
+            prompt = "".join(m.get("content", "") for m in messages)
+            reply = json.dumps({"doc_type": "Survey", "paper": {"title": "mock"}, "fit_score": 0.5})
+            usage = state.usage_for(prompt, reply)
+            time.sleep(state.delay_s(usage))
+
+            out = json.dumps({
+                "id": "mock", "object": "chat.completion", "created": int(time.time()),
+                "model": body.get("model", "mock"),
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": reply}}],
+                "usage": usage,
+            }).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(out)))
+            self.end_headers()
+            self.wfile.write(out)
+
+    return Handler
+
+def main():
+    ap = argparse.ArgumentParser(description="带 prompt 前缀缓存模拟的 OpenAI 兼容 mock 服务")
+    ap.add_argument("--host", default="127.0.0.1", help="监听地址")
+    ap.add_argument("--port", type=int, default=8765, help="监听端口")
+    ap.add_argument("--usage-style", choices=["deepseek", "openai"], default="deepseek", help="usage 中缓存字段的格式")
+    ap.add_argument("--ms-per-1k-uncached", type=float, default=200.0, help="每千个未命中缓存 token 的模拟延迟 (ms)")
+    ap.add_argument("--ms-per-1k-cached", type=float, default=20.0, help="每千个命中缓存 token 的模拟延迟 (ms)")
+    args = ap.parse_args()
+
+    state = MockState(args.ms_per_1k_uncached, args.ms_per_1k_cached, args.usage_style)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(state))
+    print(f"mock endpoint: http://{args.host}:{args.port} (usage style: {args.usage_style})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "pipeline"))
+
+import extract as E
+
+TITLE = "FooNet: a novel model"
+ABSTRACT = "We propose FooNet, a novel model. It improves BERT on GLUE. Results are strong."
+GOOD_CB = {
+    "model_names_brief": ["FooNet"],
+    "base_models_brief": ["BERT"],
+    "innovation_quotes": ["We propose FooNet, a novel model."],
+    "relation_summary_zh": "基于 BERT 架构。",
+    "relation_summary_en": "Builds on BERT.",
+}
+
+
+def _resp(content, tokens):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(total_tokens=tokens, prompt_tokens=tokens, completion_tokens=0),
+    )
+
+
+class FakeClient:
+    """Returns canned replies for the repair call"""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.sent = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.sent.append(kwargs)
+        return self.replies.pop(0)
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    E.reset_usage_stats()
+
+
+def _run(js_or_txt, client, full_tokens=3000):
+    txt = js_or_txt if isinstance(js_or_txt, str) else json.dumps(js_or_txt, ensure_ascii=False)
+    return asyncio.run(E._validate_or_repair(client, "m", txt, ABSTRACT, full_tokens, title=TITLE))
+
+
+def test_fields_the_pipeline_ignores_do_not_fail_validation():
+    # pandas reads a year column with NaN as float64, so the prompt example carries 2020.0
+    js = {"doc_type": "Variant", "paper": {"title": "t", "year": 2020.0}, "fit_score": "0.7",
+          "core_brief": {**GOOD_CB, "model_names_brief": None}}
+    assert E.validate_response(js, ABSTRACT) == []
+    assert E.validate_response({"doc_type": "Survey", "fit_score": 0.5}, ABSTRACT) == []
+
+
+def test_float_year_needs_no_repair_call():
+    js = {"doc_type": "Survey", "paper": {"title": "t", "year": 2020.0}, "fit_score": 0.5}
+    client = FakeClient()
+    assert _run(js, client) == js
+    assert client.sent == []
+
+
+def test_unknown_schema_keywords_are_rejected():
+    with pytest.raises(ValueError, match="additionalProperties"):
+        E._compile_schema({"type": "object", "additionalProperties": False})
+    with pytest.raises(ValueError, match="pattern"):
+        E._compile_schema({"properties": {"url": {"type": "string", "pattern": "^http"}}})
+
+
+@pytest.mark.parametrize("core_brief", [
+    "oops",
+    ["not", "an", "object"],
+    {**GOOD_CB, "relation_summary_zh": None},
+    {**GOOD_CB, "relation_summary_en": 42},
+])
+def test_type_errors_raise_for_full_retry_when_repair_fails(core_brief):
+    js = {"doc_type": "Variant", "paper": {"title": "t"}, "core_brief": core_brief}
+    with pytest.raises(ValueError):
+        _run(js, FakeClient(_resp("{}", 50)))
+
+
+def test_patchable_errors_fall_through_to_heuristics():
+    cb = {**GOOD_CB, "innovation_quotes": ["invented quote"], "relation_summary_zh": ""}
+    js = {"doc_type": "Variant", "core_brief": cb}
+    result = _run(js, FakeClient(_resp("{}", 50)))
+    assert result == js
+
+    row = E._build_core_brief(result, {"Abstract": ABSTRACT})
+    assert json.loads(row["innovation_quotes"])
+
+
+def test_repair_of_patchable_error_counts_as_added_cost():
+    js = {"doc_type": "Variant", "paper": {"title": "t"},
+          "core_brief": {**GOOD_CB, "innovation_quotes": ["invented quote"]}}
+    result = _run(js, FakeClient(_resp(json.dumps({"core_brief": GOOD_CB}), 300)))
+    assert result["core_brief"] == GOOD_CB
+    assert E.REPAIR_STATS["tokens_saved"] == 0
+    assert E.REPAIR_STATS["tokens_added"] == 300
+
+
+def test_repair_instead_of_full_retry_counts_as_saving():
+    truncated = '{"doc_type": "Survey", "paper": '
+    fixed = {"doc_type": "Survey", "paper": {"title": TITLE}}
+    client = FakeClient(_resp(json.dumps(fixed), 200))
+    result = _run(truncated, client)
+    assert result == fixed
+    assert E.REPAIR_STATS["tokens_saved"] == 2800
+    assert E.REPAIR_STATS["tokens_added"] == 0
+
+    prompt = client.sent[0]["messages"][1]["content"]
+    assert TITLE in prompt and ABSTRACT in prompt
+    assert prompt.count(truncated) == 1
+
+
+def test_empty_summary_repair_gets_source_text():
+    js = {"doc_type": "Variant", "core_brief": {**GOOD_CB, "relation_summary_zh": ""}}
+    client = FakeClient(_resp(json.dumps({"core_brief": GOOD_CB}), 100))
+    _run(js, client)
+    prompt = client.sent[0]["messages"][1]["content"]
+    assert TITLE in prompt and ABSTRACT in prompt
+
+
+def test_trimming_quotes_needs_no_source_text():
+    quotes = ["We propose FooNet, a novel model."] * 5
+    js = {"doc_type": "Variant", "core_brief": {**GOOD_CB, "innovation_quotes": quotes}}
+    client = FakeClient(_resp(json.dumps({"core_brief": GOOD_CB}), 100))
+    _run(js, client)
+    assert ABSTRACT not in client.sent[0]["messages"][1]["content"]
+
+
+def test_repair_calls_are_recorded_separately_and_reset():
+    fixed = {"doc_type": "Survey", "paper": {"title": "t"}}
+    _run("not json", FakeClient(_resp(json.dumps(fixed), 200)))
+    assert E.REPAIR_USAGE_STATS["calls"] == 1
+    assert E.REPAIR_USAGE_STATS["prompt_tokens"] == 200
+    assert E.USAGE_STATS["calls"] == 0
+
+    E.reset_usage_stats()
+    assert E.REPAIR_USAGE_STATS["calls"] == 0
+    assert E.REPAIR_STATS["attempts"] == 0
+
+
+def test_split_user_template_separates_paper_fields():
+    intro, paper, instructions = E._split_user_template("intro\n<TITLE>: {title}\n<ABSTRACT>:\n{abstract}\n【执行要点】\nrules {title}")
+    assert intro == "intro"
+    assert paper.startswith("<TITLE>") and "{abstract}" in paper and "【执行要点】" not in paper
+    assert instructions.startswith("【执行要点】")
+    with pytest.raises(ValueError):
+        E._split_user_template("no markers here")
+
+
+def test_cached_prefix_is_frozen_and_free_of_paper_data():
+    prefix, tmpl = E.PROMPT_LAYOUTS["cached"]
+    for field in ("title", "abstract", "year", "venue", "url"):
+        assert "{" + field + "}" not in prefix
+    assert prefix.startswith(E.SYSTEM_MESSAGE)
+
+    a = E.fmt_user("Paper A", "Abstract A", 2020.0, "V", "U", tmpl=tmpl)
+    b = E.fmt_user("Paper B", "Abstract B", 2021, "", "", tmpl=tmpl)
+    assert "Paper A" not in prefix and "Abstract A" in a and "Abstract B" in b
+    assert a.startswith("<TITLE>") and "【执行要点】" not in a
+
+
+def test_legacy_layout_is_unchanged():
+    system, tmpl = E.PROMPT_LAYOUTS["legacy"]
+    assert system == E.SYSTEM + "\n\nJSON Schema (for reference):\n" + E.SCHEMA
+    assert tmpl is E.USER_TMPL
+    assert E.fmt_user("T", "A", 2020) == E.fmt_user("T", "A", 2020, tmpl=E.USER_TMPL)
+
+
+@pytest.mark.parametrize("usage, expected", [
+    (SimpleNamespace(prompt_tokens=100, prompt_cache_hit_tokens=64, prompt_cache_miss_tokens=36), 64),
+    (SimpleNamespace(prompt_tokens=100, prompt_tokens_details=SimpleNamespace(cached_tokens=80)), 80),
+    (SimpleNamespace(prompt_tokens=100, prompt_tokens_details=None), 0),
+    (None, 0),
+])
+def test_cached_tokens_reads_deepseek_and_openai_usage(usage, expected):
+    assert E._cached_tokens(usage) == expected
+
+
+def test_record_usage_accumulates_cached_tokens():
+    resp = SimpleNamespace(usage=SimpleNamespace(prompt_tokens=100, completion_tokens=10, prompt_cache_hit_tokens=64))
+    E._record_usage(resp, 0.5)
+    E._record_usage(resp, 0.25)
+    assert E.USAGE_STATS["calls"] == 2
+    assert E.USAGE_STATS["cached_tokens"] == 128
+    assert E.USAGE_STATS["latency_s"] == pytest.approx(0.75)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+仪表板数据生成脚本的规模基准测试
+对 generate_dashboard_data.py 与 generate_evolution_tree.py 的每个阶段
+（读取、解析列表、explode、groupby、建树、JSON 写出）分别计时并记录峰值内存。
+
+每个（行数, 脚本）组合在独立子进程中运行，进程峰值 RSS 互不影响；
+计时不开启 tracemalloc，峰值内存由后台线程采样 RSS 得到。
+
+用法：
+    python benchmarks/bench_generators.py --rows 10k 100k 1M
+"""
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+
+from synthetic_corpus import corpus_path, parse_size, write_synthetic_corpus
+
+RSS_SAMPLE_INTERVAL = 0.01
+
+
+def _current_rss_mb():
+    """当前 RSS（MB），仅 Linux 可用，其他平台返回 None"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+    except OSError:
+        return None
+    return pages * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+
+
+def _max_rss_mb():
+    """进程峰值 RSS（MB）；Windows 没有 resource 模块，返回 None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 以 KB 计，macOS 以字节计
+    return rss / 1024 ** 2 if sys.platform == "darwin" else rss / 1024
+
+
+class RssSampler:
+    """后台线程定期采样 RSS，记录阶段内峰值；开销远小于 tracemalloc"""
+
+    def __init__(self, interval=RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            rss = _current_rss_mb()
+            if rss is not None and (self.peak is None or rss > self.peak):
+                self.peak = rss
+
+    def __enter__(self):
+        self.peak = _current_rss_mb()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        rss = _current_rss_mb()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+
+class StageTimer:
+    """逐阶段记录耗时（秒）与阶段内峰值 RSS（MB）"""
+
+    def __init__(self):
+        self.results = []
+
+    def run(self, name, fn, *args):
+        gc.collect()
+        with RssSampler() as sampler:
+            start = time.perf_counter()
+            value = fn(*args)
+            elapsed = time.perf_counter() - start
+        self.results.append({"stage": name, "seconds": elapsed, "peak_rss_mb": sampler.peak})
+        return value
+
+
+def bench_dashboard(csv_path, out_dir):
+    import generate_dashboard_data as dashboard
+
+    t = StageTimer()
+    df = t.run("load", dashboard.load_data, csv_path)
+    df = t.run("parse_lists", dashboard.parse_list_columns, df)
+    df_exploded = t.run("explode", dashboard.explode_base_models, df)
+
+    def groupby():
+        chart1, chart2 = dashboard.build_evolution_charts(df)
+        chart3, chart4 = dashboard.build_influence_charts(df_exploded)
+        return {"evolution_l1": chart1, "evolution_nature": chart2,
+                "model_influence": chart3, "sankey_flow": chart4}
+
+    data = t.run("groupby", groupby)
+    t.run("json_dump", dashboard.save_dashboard_data, data, out_dir / "dashboard_data.json")
+    return t.results
+
+
+def bench_evolution_tree(csv_path, out_dir):
+    import generate_evolution_tree as evolution
+
+    t = StageTimer()
+    df = t.run("load", evolution.load_data, csv_path)
+    df = t.run("parse_lists", evolution.parse_list_columns, df)
+    tree = t.run("tree_build", evolution.build_evolution_tree, df)
+    t.run("json_dump", evolution.save_evolution_tree, tree, out_dir / "evolution_tree.json")
+    return t.results
+
+
+BENCHES = {"dashboard": bench_dashboard, "tree": bench_evolution_tree}
+
+
+def run_worker(name, csv_path, out_dir, result_file):
+    """子进程入口：跑一个脚本的全部阶段，把结果写入 result_file"""
+    stages = BENCHES[name](Path(csv_path), Path(out_dir))
+    with open(result_file, 'w', encoding='utf-8') as f:
+        json.dump({"stages": stages, "max_rss_mb": _max_rss_mb()}, f)
+
+
+def run_in_subprocess(name, csv_path, out_dir):
+    result_file = Path(out_dir) / f".{name}_result.json"
+    subprocess.run(
+        [sys.executable, __file__, "--worker", name, "--csv", str(csv_path),
+         "--out-dir", str(out_dir), "--result", str(result_file)],
+        check=True,
+    )
+    with open(result_file, encoding='utf-8') as f:
+        result = json.load(f)
+    result_file.unlink()
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser(description="仪表板数据生成脚本规模基准测试")
+    ap.add_argument("--rows", nargs="+", default=["10k", "100k", "1M", "10M"],
+                    help="合成数据行数，可写 10k / 1M 等")
+    ap.add_argument("--data-dir", default=str(HERE / "data"), help="合成 CSV 缓存目录")
+    ap.add_argument("--out-dir", default=str(HERE / "output"), help="基准输出目录")
+    ap.add_argument("--only", choices=list(BENCHES), default=None, help="只测试其中一个脚本")
+    ap.add_argument("--seed", type=int, default=0, help="随机种子")
+    # 内部参数：子进程模式
+    ap.add_argument("--worker", choices=list(BENCHES), help=argparse.SUPPRESS)
+    ap.add_argument("--csv", help=argparse.SUPPRESS)
+    ap.add_argument("--result", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.csv, args.out_dir, args.result)
+        return
+
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    names = [args.only] if args.only else list(BENCHES)
+
+    report = []
+    for size in args.rows:
+        n_rows = parse_size(size)
+        csv_path = corpus_path(args.data_dir, n_rows, args.seed)
+        if not csv_path.exists():
+            print(f"生成合成数据 {csv_path} ({n_rows:,} 行)...", flush=True)
+            write_synthetic_corpus(csv_path, n_rows, seed=args.seed)
+
+        for name in names:
+            result = run_in_subprocess(name, csv_path, out_dir)
+            stages = result["stages"]
+            total = sum(s["seconds"] for s in stages)
+            report.append({"generator": name, "rows": n_rows, "seed": args.seed, "stages": stages,
+                           "total_seconds": total, "max_rss_mb": result["max_rss_mb"]})
+
+            rss = f"{result['max_rss_mb']:.0f}MB" if result["max_rss_mb"] is not None else "n/a"
+            print(f"\n[{name}] {n_rows:,} 行  总计 {total:.2f}s  进程峰值 RSS {rss}")
+            for s in stages:
+                peak = f"{s['peak_rss_mb']:10.1f}MB" if s["peak_rss_mb"] is not None else ""
+                print(f"  {s['stage']:<12} {s['seconds']:9.3f}s {peak}")
+
+    report_file = out_dir / "bench_results.json"
+    with open(report_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n结果已保存到: {report_file}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+生成合成聚类结果 CSV（与 5_bertopic_results_vocab.csv 同结构），用于规模基准测试
+- 基础模型按 Zipf 分布抽样（少数头部模型占据大部分引用）
+- 一级主题 -> 二级主题 两层主题体系
+- 年份向近年倾斜
+- 列表字段以 Python 列表字面量写出，与真实数据一致
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+LEVEL1_TOPICS = [
+    '决策与搜索创新', '时序与动态创新', '架构与拓扑创新',
+    '特定几何/结构创新', '生成与分布创新', '训练范式与学习策略创新',
+]
+
+HEAD_BASE_MODELS = [
+    'Transformer', 'CNN', 'GAN', 'BERT', 'CLIP', 'GNN', 'Diffusion Models',
+    'LSTM', 'NeRF', 'SVM', 'RNN', 'ResNet', 'Vision Transformer', 'LLM',
+    'GPT', 'RoBERTa', 'T5', 'VAE', 'U-Net', 'YOLO',
+]
+
+DOC_TYPES = ['Model', 'Variant', 'AdapterModel']
+DOC_TYPE_WEIGHTS = [0.25, 0.6, 0.15]
+
+CHUNK_ROWS = 500_000
+
+
+def parse_size(text):
+    """'10k' / '1M' / '10M' -> 行数"""
+    text = str(text).strip().lower()
+    scale = {'k': 1_000, 'm': 1_000_000}.get(text[-1:], 1)
+    if scale != 1:
+        text = text[:-1]
+    return int(float(text) * scale)
+
+
+def corpus_path(data_dir, n_rows, seed=0):
+    """缓存文件名取解析后的行数与种子：1M / 1m / 1000k 共用一个文件，不同 --seed 不复用"""
+    return Path(data_dir) / f"synthetic_{int(n_rows)}_seed{seed}.csv"
+
+
+def _zipf_weights(n, s):
+    w = 1.0 / np.arange(1, n + 1) ** s
+    return w / w.sum()
+
+
+def _list_literals(pool, counts, weights, rng):
+    """按每行个数从 pool 中抽样，返回列表字面量字符串"""
+    picks = rng.choice(len(pool), size=int(counts.sum()), p=weights)
+    out, pos = [], 0
+    for k in counts:
+        out.append(repr([pool[i] for i in picks[pos:pos + k]]))
+        pos += k
+    return out
+
+
+def generate_chunk(n_rows, rng, base_pool, base_weights, level2_topics,
+                   model_pool, years, year_weights, null_rate=0.02):
+    """生成 n_rows 行合成数据"""
+    l1_idx = rng.integers(0, len(LEVEL1_TOPICS), size=n_rows)
+    l2_pos = rng.integers(0, len(level2_topics[0]), size=n_rows)
+    level1 = [LEVEL1_TOPICS[i] for i in l1_idx]
+    level2 = [level2_topics[i][j] for i, j in zip(l1_idx, l2_pos)]
+
+    base_counts = rng.choice(4, size=n_rows, p=[0.1, 0.55, 0.25, 0.1])
+    name_counts = rng.choice(3, size=n_rows, p=[0.15, 0.7, 0.15])
+    base_models = _list_literals(base_pool, base_counts, base_weights, rng)
+    model_names = _list_literals(model_pool, name_counts, None, rng)
+
+    df = pd.DataFrame({
+        'Title': [f'Synthetic paper on {t}' for t in level2],
+        'Publication year': rng.choice(years, size=n_rows, p=year_weights),
+        'doc_type': rng.choice(DOC_TYPES, size=n_rows, p=DOC_TYPE_WEIGHTS),
+        'model_names_brief': model_names,
+        'base_models_brief': base_models,
+        'relation_summary_zh': [f'基于基础模型的{t}改进。' for t in level2],
+        '一级主题': level1,
+        '二级主题': level2,
+    })
+
+    # 少量缺失值，覆盖脚本中的空值分支
+    for col in ('model_names_brief', 'base_models_brief'):
+        df.loc[rng.random(n_rows) < null_rate, col] = np.nan
+    return df
+
+
+def write_synthetic_corpus(path, n_rows, seed=0, n_base_models=2_000, zipf_s=1.2,
+                           n_level2=12, n_model_names=50_000,
+                           year_range=(2000, 2024), year_growth=0.25):
+    """分块写出合成 CSV，避免 10M 行时一次性占用内存；写完最后一块才改名，中断不会留下残缺文件"""
+    if n_rows <= 0:
+        raise ValueError(f"n_rows 必须为正整数: {n_rows}")
+    rng = np.random.default_rng(seed)
+    base_pool = HEAD_BASE_MODELS + [
+        f'Base-{i}' for i in range(max(0, n_base_models - len(HEAD_BASE_MODELS)))
+    ]
+    base_weights = _zipf_weights(len(base_pool), zipf_s)
+    level2_topics = [[f'{l1}-子主题{j}' for j in range(n_level2)] for l1 in LEVEL1_TOPICS]
+    model_pool = [f'Model-{i}' for i in range(n_model_names)]
+    years = np.arange(year_range[0], year_range[1] + 1)
+    year_weights = np.exp(year_growth * (years - years[0]))
+    year_weights /= year_weights.sum()
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    written = 0
+    while written < n_rows:
+        n = min(CHUNK_ROWS, n_rows - written)
+        chunk = generate_chunk(n, rng, base_pool, base_weights, level2_topics,
+                               model_pool, years, year_weights)
+        chunk.to_csv(tmp_path, mode='w' if written == 0 else 'a',
+                     header=written == 0, index=False)
+        written += n
+    os.replace(tmp_path, path)
+    return path
+
+
+def main():
+    ap = argparse.ArgumentParser(description="生成合成聚类结果 CSV")
+    ap.add_argument("--rows", nargs="+", default=["10k", "100k", "1M", "10M"],
+                    help="行数，可写 10k / 1M 等")
+    ap.add_argument("--out-dir", default=str(Path(__file__).resolve().parent / "data"),
+                    help="输出目录")
+    ap.add_argument("--seed", type=int, default=0, help="随机种子")
+    args = ap.parse_args()
+
+    for size in args.rows:
+        n_rows = parse_size(size)
+        path = write_synthetic_corpus(corpus_path(args.out_dir, n_rows, args.seed), n_rows, seed=args.seed)
+        print(f"已生成 {path} ({n_rows:,} 行)")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,22 +6,29 @@
 """
 
 import pandas as pd
+import argparse
 import json
 from collections import defaultdict
 
-def generate_evolution_tree():
-    """生成演化树数据"""
-    print("正在读取数据...")
-    df = pd.read_csv('5_bertopic_results_vocab.csv')
-    
-    # 解析列表字段
+DEFAULT_INPUT = '5_bertopic_results_vocab.csv'
+DEFAULT_OUTPUT = 'dashboard/public/data/evolution_tree.json'
+
+def load_data(input_file=DEFAULT_INPUT):
+    """读取聚类结果"""
+    return pd.read_csv(input_file)
+
+def parse_list_columns(df):
+    """解析列表字段"""
     df['model_names_brief'] = df['model_names_brief'].apply(
         lambda x: eval(x) if isinstance(x, str) and x.startswith('[') else []
     )
     df['base_models_brief'] = df['base_models_brief'].apply(
         lambda x: eval(x) if isinstance(x, str) and x.startswith('[') else []
     )
-    
+    return df
+
+def build_evolution_tree(df):
+    """由已解析列表字段的数据构建树"""
     # 构建树形结构
     tree = {
         "name": "AI创新机制演化树",
@@ -108,9 +115,25 @@ def generate_evolution_tree():
     
     return tree
 
+def generate_evolution_tree(input_file=DEFAULT_INPUT):
+    """生成演化树数据"""
+    print("正在读取数据...")
+    df = load_data(input_file)
+    return build_evolution_tree(parse_list_columns(df))
+
+def save_evolution_tree(tree, output_file=DEFAULT_OUTPUT):
+    """保存演化树 JSON"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(tree, f, ensure_ascii=False, indent=2)
+
 def main():
+    ap = argparse.ArgumentParser(description="生成技术演化树数据 evolution_tree.json")
+    ap.add_argument("--in", dest="infile", default=DEFAULT_INPUT, help="聚类结果 CSV 文件")
+    ap.add_argument("--out", dest="outfile", default=DEFAULT_OUTPUT, help="输出 JSON 文件")
+    args = ap.parse_args()
+
     print("正在生成技术演化树数据...")
-    tree = generate_evolution_tree()
+    tree = generate_evolution_tree(args.infile)
     
     # 统计信息
     base_model_count = len(tree['children'])
@@ -129,11 +152,9 @@ def main():
     print(f"  总节点数: {1 + base_model_count + level1_count + leaf_count}")
     
     # 保存到文件
-    output_file = 'dashboard/public/data/evolution_tree.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(tree, f, ensure_ascii=False, indent=2)
+    save_evolution_tree(tree, args.outfile)
     
-    print(f"\n已保存到: {output_file}")
+    print(f"\n已保存到: {args.outfile}")
     print("完成！")
 
 if __name__ == '__main__':